@@ -132,13 +132,12 @@ class DeployContext:
         if template_size > 51200 and not self.s3_bucket:
             raise deploy_exceptions.DeployBucketRequiredError()
         boto_config = get_boto_config_with_user_agent()
-        cloudformation_client = boto3.client(
-            "cloudformation", region_name=self.region if self.region else None, config=boto_config
-        )
+        region_name = self.region or None
+        cloudformation_client = boto3.client("cloudformation", region_name=region_name, config=boto_config)
 
         s3_client = None
         if self.s3_bucket:
-            s3_client = boto3.client("s3", region_name=self.region if self.region else None, config=boto_config)
+            s3_client = boto3.client("s3", region_name=region_name, config=boto_config)
 
             self.s3_uploader = S3Uploader(
                 s3_client, self.s3_bucket, self.s3_prefix, self.kms_key_id, self.force_upload, self.no_progressbar
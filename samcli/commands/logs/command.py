@@ -153,7 +153,7 @@ def do_cli(
     from samcli.commands.logs.logs_context import parse_time, ResourcePhysicalIdResolver
     from samcli.commands.logs.puller_factory import generate_puller
     from samcli.lib.observability.util import OutputOption
-    from samcli.lib.utils.boto_utils import get_boto_client_provider_with_config, get_boto_resource_provider_with_config
+    from samcli.lib.utils.boto_utils import get_boto_client_provider_with_config
 
     if not names or len(names) > 1:
         if not prompt_experimental(ExperimentalFlag.Accelerate):
@@ -168,8 +168,7 @@ def do_cli(
     sanitized_end_time = parse_time(end_time, "end-time") or datetime.utcnow()
 
     boto_client_provider = get_boto_client_provider_with_config(region=region, profile=profile)
-    boto_resource_provider = get_boto_resource_provider_with_config(region=region, profile=profile)
-    resource_logical_id_resolver = ResourcePhysicalIdResolver(boto_resource_provider, stack_name, names)
+    resource_logical_id_resolver = ResourcePhysicalIdResolver(boto_client_provider, stack_name, names)
 
     # only fetch all resources when no CloudWatch log group defined
     fetch_all_when_no_resource_name_given = not cw_log_groups
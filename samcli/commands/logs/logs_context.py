@@ -72,12 +72,12 @@ class ResourcePhysicalIdResolver:
 
     def __init__(
         self,
-        boto_resource_provider: BotoProviderType,
+        boto_client_provider: BotoProviderType,
         stack_name: str,
         resource_names: Optional[List[str]] = None,
         supported_resource_types: Optional[Set[str]] = None,
     ):
-        self._boto_resource_provider = boto_resource_provider
+        self._boto_client_provider = boto_client_provider
         self._stack_name = stack_name
         if resource_names is None:
             resource_names = []
@@ -126,7 +126,7 @@ class ResourcePhysicalIdResolver:
         """
         LOG.debug("Getting logical id of the all resources for stack '%s'", self._stack_name)
         stack_resources = get_resource_summaries(
-            self._boto_resource_provider, self._stack_name, ResourcePhysicalIdResolver.DEFAULT_SUPPORTED_RESOURCES
+            self._boto_client_provider, self._stack_name, ResourcePhysicalIdResolver.DEFAULT_SUPPORTED_RESOURCES
         )
 
         if selected_resource_names:
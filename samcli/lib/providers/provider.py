@@ -7,7 +7,8 @@ import logging
 import os
 import posixpath
 from collections import namedtuple
-from typing import Any, Set, NamedTuple, Optional, List, Dict, Tuple, Union, cast, Iterator, TYPE_CHECKING
+from functools import lru_cache
+from typing import Any, Set, NamedTuple, Optional, List, Dict, Tuple, Union, cast, Iterable, Iterator, TYPE_CHECKING
 
 from samcli.commands.local.cli_common.user_exceptions import (
     InvalidLayerVersionArn,
@@ -582,9 +583,14 @@ class Stack:
 class ResourceIdentifier:
     """Resource identifier for representing a resource with nested stack support"""
 
+    # identifiers are created for every resource in the stacks, parse once and keep a fixed attribute layout
+    __slots__ = ("_raw", "_stack_path", "_resource_iac_id", "_hash")
+
+    _raw: str
     _stack_path: str
     # resource_iac_id is the resource logical id in case of CFN, or customer defined construct Id in case of CDK.
     _resource_iac_id: str
+    _hash: int
 
     def __init__(self, resource_identifier_str: str):
         """
@@ -594,15 +600,39 @@ class ResourceIdentifier:
             Resource identifier in the format of:
             Stack1/Stack2/ResourceID
         """
-        parts = resource_identifier_str.rsplit(posixpath.sep, 1)
-        if len(parts) == 1:
-            self._stack_path = ""
-            # resource_iac_id in this case can be the resource iac id or logical id
-            self._resource_iac_id = parts[0]
-        else:
-            self._stack_path = parts[0]
-            # resource_iac_id in this case will be always the resource iac id
-            self._resource_iac_id = parts[1]
+        # resource_iac_id can be the resource iac id or logical id if there is no stack path,
+        # otherwise it will be always the resource iac id
+        self._stack_path, _, self._resource_iac_id = resource_identifier_str.rpartition(posixpath.sep)
+        self._raw = (
+            self._stack_path + posixpath.sep + self._resource_iac_id if self._stack_path else self._resource_iac_id
+        )
+        self._hash = hash(self._raw)
+
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def of(cls, resource_identifier_str: str) -> "ResourceIdentifier":
+        """
+        Returns a shared ResourceIdentifier instance for the given string, so that identifiers which are created
+        repeatedly for the same resource are not parsed and hashed again
+
+        Parameters
+        ----------
+        resource_identifier_str : str
+            Resource identifier in the format of:
+            Stack1/Stack2/ResourceID
+        """
+        return cls(resource_identifier_str)
+
+    @property
+    def raw(self) -> str:
+        """
+        Returns
+        -------
+        str
+            Normalized identifier string, same as str(identifier) without the call overhead.
+            Read-only, since instances returned by ResourceIdentifier.of are shared.
+        """
+        return self._raw
 
     @property
     def stack_path(self) -> str:
@@ -626,13 +656,13 @@ class ResourceIdentifier:
         return self._resource_iac_id
 
     def __str__(self) -> str:
-        return self.stack_path + posixpath.sep + self.resource_iac_id if self.stack_path else self.resource_iac_id
+        return self._raw
 
     def __eq__(self, other: object) -> bool:
-        return str(self) == str(other) if isinstance(other, ResourceIdentifier) else False
+        return self._raw == other._raw if isinstance(other, ResourceIdentifier) else False
 
     def __hash__(self) -> int:
-        return hash(str(self))
+        return self._hash
 
 
 def get_full_path(stack_path: str, resource_id: str) -> str:
@@ -646,7 +676,10 @@ def get_full_path(stack_path: str, resource_id: str) -> str:
 
 
 def get_resource_by_id(
-    stacks: List[Stack], identifier: ResourceIdentifier, explicit_nested: bool = False
+    stacks: List[Stack],
+    identifier: ResourceIdentifier,
+    explicit_nested: bool = False,
+    index: Optional["ResourceIndex"] = None,
 ) -> Optional[Dict[str, Any]]:
     """Seach resource in stacks based on identifier
 
@@ -660,12 +693,18 @@ def get_resource_by_id(
         Set to True to only search in root stack if stack_path does not exist.
         Otherwise, all stacks will be searched in order to find matching logical ID.
         If stack_path does exist in identifier, this option will be ignored and behave as if it is True
+    index : Optional[ResourceIndex], optional
+        Index built from the same stacks by build_resource_index. If given, the resource is looked up from the index
+        instead of searching the stacks, unless explicit_nested is set for an identifier without stack_path
 
     Returns
     -------
     Dict
         Resource dict
     """
+    if index is not None and (identifier.stack_path or not explicit_nested):
+        return index.get(identifier)
+
     search_all_stacks = not identifier.stack_path and not explicit_nested
     for stack in stacks:
         if stack.stack_path == identifier.stack_path or search_all_stacks:
@@ -683,6 +722,59 @@ def get_resource_by_id(
     return None
 
 
+class ResourceIndex(NamedTuple):
+    """
+    Lookup tables for resources in a list of stacks, built once by build_resource_index
+    so that repeated searches do not need to scan every stack
+    """
+
+    # (stack_path, resource_iac_id) -> resource dict
+    explicit: Dict[Tuple[str, str], Dict[str, Any]]
+    # resource_iac_id or logical_id -> first matching resource dict across all stacks
+    implicit: Dict[str, Dict[str, Any]]
+
+    def get(self, identifier: ResourceIdentifier) -> Optional[Dict[str, Any]]:
+        """Same as get_resource_by_id with explicit_nested set to False
+
+        Parameters
+        ----------
+        identifier : ResourceIdentifier
+            Resource identifier for the resource to be returned
+
+        Returns
+        -------
+        Dict
+            Resource dict
+        """
+        if identifier.stack_path:
+            return self.explicit.get((identifier.stack_path, identifier.resource_iac_id))
+        return self.implicit.get(identifier.resource_iac_id)
+
+
+def build_resource_index(stacks: List[Stack]) -> ResourceIndex:
+    """Index resources in stacks by their identifiers
+
+    Parameters
+    ----------
+    stacks : List[Stack]
+        List of stacks to be indexed
+
+    Returns
+    -------
+    ResourceIndex
+        Lookup tables matching the search order of get_resource_by_id
+    """
+    explicit: Dict[Tuple[str, str], Dict[str, Any]] = {}
+    implicit: Dict[str, Dict[str, Any]] = {}
+    for stack in stacks:
+        for logical_id, resource in stack.resources.items():
+            resource_id = ResourceMetadataNormalizer.get_resource_id(resource, logical_id)
+            explicit.setdefault((stack.stack_path, resource_id), resource)
+            implicit.setdefault(resource_id, resource)
+            implicit.setdefault(logical_id, resource)
+    return ResourceIndex(explicit, implicit)
+
+
 def get_resource_full_path_by_id(stacks: List[Stack], identifier: ResourceIdentifier) -> Optional[str]:
     """Seach resource in stacks based on identifier
 
@@ -730,10 +822,43 @@ def get_resource_ids_by_type(stacks: List[Stack], resource_type: str) -> List[Re
         for logical_id, resource in stack.resources.items():
             resource_id = ResourceMetadataNormalizer.get_resource_id(resource, logical_id)
             if resource.get("Type", "") == resource_type:
-                resource_ids.append(ResourceIdentifier(get_full_path(stack.stack_path, resource_id)))
+                resource_ids.append(ResourceIdentifier.of(get_full_path(stack.stack_path, resource_id)))
     return resource_ids
 
 
+def build_type_index(
+    stacks: List[Stack], resource_types: Optional[Iterable[str]] = None
+) -> Dict[str, List[ResourceIdentifier]]:
+    """Return resource IDs in stacks grouped by their resource type,
+    so that looking up several types only walks through the stacks once
+
+    Parameters
+    ----------
+    stacks : List[Stack]
+        List of stacks
+    resource_types : Optional[Iterable[str]]
+        Only index resources with these types. All resources are indexed if it is None
+
+    Returns
+    -------
+    Dict[str, List[ResourceIdentifier]]
+        Mapping between resource type and ResourceIdentifiers with that type,
+        in the same order as get_resource_ids_by_type would return them
+    """
+    requested_types = set(resource_types) if resource_types is not None else None
+    type_index: Dict[str, List[ResourceIdentifier]] = {}
+    for stack in stacks:
+        for logical_id, resource in stack.resources.items():
+            resource_type = resource.get("Type", "")
+            if requested_types is not None and resource_type not in requested_types:
+                continue
+            resource_id = ResourceMetadataNormalizer.get_resource_id(resource, logical_id)
+            type_index.setdefault(resource_type, []).append(
+                ResourceIdentifier.of(get_full_path(stack.stack_path, resource_id))
+            )
+    return type_index
+
+
 def get_all_resource_ids(stacks: List[Stack]) -> List[ResourceIdentifier]:
     """Return all resource IDs in stacks
 
@@ -751,7 +876,7 @@ def get_all_resource_ids(stacks: List[Stack]) -> List[ResourceIdentifier]:
     for stack in stacks:
         for logical_id, resource in stack.resources.items():
             resource_id = ResourceMetadataNormalizer.get_resource_id(resource, logical_id)
-            resource_ids.append(ResourceIdentifier(get_full_path(stack.stack_path, resource_id)))
+            resource_ids.append(ResourceIdentifier.of(get_full_path(stack.stack_path, resource_id)))
     return resource_ids
 
 
@@ -782,10 +907,9 @@ def get_unique_resource_ids(
             output_resource_ids.add(ResourceIdentifier(resources_id))
 
     if resource_types:
+        type_index = build_type_index(stacks, resource_types)
         for resource_type in resource_types:
-            resource_type_ids = get_resource_ids_by_type(stacks, resource_type)
-            for resource_id in resource_type_ids:
-                output_resource_ids.add(resource_id)
+            output_resource_ids.update(type_index.get(resource_type, []))
     return output_resource_ids
 
 
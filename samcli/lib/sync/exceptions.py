@@ -1,5 +1,5 @@
 """Exceptions related to sync functionalities"""
-from typing import Dict, Optional, TYPE_CHECKING
+from typing import Mapping, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no cover
     from samcli.lib.sync.sync_flow import SyncFlow
@@ -77,17 +77,17 @@ class MissingPhysicalResourceError(Exception):
     """Exception used for not having a remote/physical counterpart for a local stack resource"""
 
     _resource_identifier: Optional[str]
-    _physical_resource_mapping: Optional[Dict[str, str]]
+    _physical_resource_mapping: Optional[Mapping[str, str]]
 
     def __init__(
-        self, resource_identifier: Optional[str] = None, physical_resource_mapping: Optional[Dict[str, str]] = None
+        self, resource_identifier: Optional[str] = None, physical_resource_mapping: Optional[Mapping[str, str]] = None
     ):
         """
         Parameters
         ----------
         resource_identifier : str
             Logical resource identifier
-        physical_resource_mapping: Dict[str, str]
+        physical_resource_mapping: Mapping[str, str]
             Current mapping between logical and physical IDs
         """
         super().__init__(f"{resource_identifier} is not found in remote.")
@@ -105,11 +105,11 @@ class MissingPhysicalResourceError(Exception):
         return self._resource_identifier
 
     @property
-    def physical_resource_mapping(self) -> Optional[Dict[str, str]]:
+    def physical_resource_mapping(self) -> Optional[Mapping[str, str]]:
         """
         Returns
         -------
-        Optional[Dict[str, str]]
+        Optional[Mapping[str, str]]
             Physical ID mapping for resources when the excecption was raised
         """
         return self._physical_resource_mapping
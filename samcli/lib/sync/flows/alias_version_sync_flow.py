@@ -1,6 +1,6 @@
 """SyncFlow for Lambda Function Alias and Version"""
 import logging
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, List, Mapping, Optional, TYPE_CHECKING
 
 from samcli.lib.providers.provider import Stack
 from samcli.lib.sync.sync_flow import SyncFlow, ResourceAPICall
@@ -27,7 +27,7 @@ class AliasVersionSyncFlow(SyncFlow):
         alias_name: str,
         build_context: "BuildContext",
         deploy_context: "DeployContext",
-        physical_id_mapping: Dict[str, str],
+        physical_id_mapping: Mapping[str, str],
         stacks: Optional[List[Stack]] = None,
     ):
         """
@@ -41,7 +41,7 @@ class AliasVersionSyncFlow(SyncFlow):
             BuildContext
         deploy_context : DeployContext
             DeployContext
-        physical_id_mapping : Dict[str, str]
+        physical_id_mapping : Mapping[str, str]
             Physical ID Mapping
         stacks : Optional[List[Stack]]
             Stacks
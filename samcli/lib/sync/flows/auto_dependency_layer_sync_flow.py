@@ -6,7 +6,7 @@ import logging
 import os
 import tempfile
 import uuid
-from typing import List, TYPE_CHECKING, Dict, cast, Optional
+from typing import List, Mapping, TYPE_CHECKING, cast, Optional
 
 from samcli.lib.bootstrap.nested_stack.nested_stack_builder import NestedStackBuilder
 from samcli.lib.bootstrap.nested_stack.nested_stack_manager import NestedStackManager
@@ -49,7 +49,7 @@ class AutoDependencyLayerSyncFlow(AbstractLayerSyncFlow):
         build_graph: BuildGraph,
         build_context: "BuildContext",
         deploy_context: "DeployContext",
-        physical_id_mapping: Dict[str, str],
+        physical_id_mapping: Mapping[str, str],
         stacks: List[Stack],
     ):
         super().__init__(
@@ -1,6 +1,6 @@
 """Base SyncFlow for Lambda Function"""
 import logging
-from typing import Any, Dict, List, TYPE_CHECKING, cast
+from typing import Any, Dict, List, Mapping, TYPE_CHECKING, cast
 
 from samcli.lib.providers.sam_function_provider import SamFunctionProvider
 from samcli.lib.sync.flows.alias_version_sync_flow import AliasVersionSyncFlow
@@ -29,7 +29,7 @@ class FunctionSyncFlow(SyncFlow):
         function_identifier: str,
         build_context: "BuildContext",
         deploy_context: "DeployContext",
-        physical_id_mapping: Dict[str, str],
+        physical_id_mapping: Mapping[str, str],
         stacks: List[Stack],
     ):
         """
@@ -41,7 +41,7 @@ class FunctionSyncFlow(SyncFlow):
             BuildContext
         deploy_context : DeployContext
             DeployContext
-        physical_id_mapping : Dict[str, str]
+        physical_id_mapping : Mapping[str, str]
             Physical ID Mapping
         stacks : Optional[List[Stack]]
             Stacks
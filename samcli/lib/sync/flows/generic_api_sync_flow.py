@@ -1,7 +1,7 @@
 """SyncFlow interface for HttpApi and RestApi"""
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional, TYPE_CHECKING, cast
+from typing import Any, List, Mapping, Optional, TYPE_CHECKING, cast
 
 from samcli.lib.sync.sync_flow import SyncFlow, ResourceAPICall
 from samcli.lib.providers.provider import Stack, get_resource_by_id, ResourceIdentifier
@@ -29,7 +29,7 @@ class GenericApiSyncFlow(SyncFlow):
         api_identifier: str,
         build_context: "BuildContext",
         deploy_context: "DeployContext",
-        physical_id_mapping: Dict[str, str],
+        physical_id_mapping: Mapping[str, str],
         log_name: str,
         stacks: List[Stack],
     ):
@@ -42,7 +42,7 @@ class GenericApiSyncFlow(SyncFlow):
             BuildContext used for build related parameters
         deploy_context : BuildContext
             DeployContext used for this deploy related parameters
-        physical_id_mapping : Dict[str, str]
+        physical_id_mapping : Mapping[str, str]
             Mapping between resource logical identifier and physical identifier
         log_name: str
             Log name passed from subclasses, HttpApi or RestApi
@@ -1,6 +1,6 @@
 """SyncFlow for HttpApi"""
 import logging
-from typing import Dict, List, TYPE_CHECKING
+from typing import List, Mapping, TYPE_CHECKING
 
 from samcli.lib.sync.flows.generic_api_sync_flow import GenericApiSyncFlow
 from samcli.lib.providers.provider import ResourceIdentifier, Stack
@@ -23,7 +23,7 @@ class HttpApiSyncFlow(GenericApiSyncFlow):
         api_identifier: str,
         build_context: "BuildContext",
         deploy_context: "DeployContext",
-        physical_id_mapping: Dict[str, str],
+        physical_id_mapping: Mapping[str, str],
         stacks: List[Stack],
     ):
         """
@@ -35,7 +35,7 @@ class HttpApiSyncFlow(GenericApiSyncFlow):
             BuildContext used for build related parameters
         deploy_context : BuildContext
             DeployContext used for this deploy related parameters
-        physical_id_mapping : Dict[str, str]
+        physical_id_mapping : Mapping[str, str]
             Mapping between resource logical identifier and physical identifier
         stacks : List[Stack], optional
             List of stacks containing a root stack and optional nested stacks
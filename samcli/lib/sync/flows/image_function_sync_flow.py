@@ -1,6 +1,6 @@
 """SyncFlow for Image based Lambda Functions"""
 import logging
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, List, Mapping, Optional, TYPE_CHECKING
 
 import docker
 from docker.client import DockerClient
@@ -29,7 +29,7 @@ class ImageFunctionSyncFlow(FunctionSyncFlow):
         function_identifier: str,
         build_context: "BuildContext",
         deploy_context: "DeployContext",
-        physical_id_mapping: Dict[str, str],
+        physical_id_mapping: Mapping[str, str],
         stacks: List[Stack],
         docker_client: Optional[DockerClient] = None,
     ):
@@ -42,7 +42,7 @@ class ImageFunctionSyncFlow(FunctionSyncFlow):
             BuildContext
         deploy_context : DeployContext
             DeployContext
-        physical_id_mapping : Dict[str, str]
+        physical_id_mapping : Mapping[str, str]
             Physical ID Mapping
         stacks : Optional[List[Stack]]
             Stacks
@@ -7,7 +7,7 @@ import re
 import tempfile
 import uuid
 from abc import ABC, abstractmethod
-from typing import Any, TYPE_CHECKING, cast, Dict, List, Optional
+from typing import Any, TYPE_CHECKING, cast, Dict, List, Mapping, Optional
 
 from samcli.lib.build.app_builder import ApplicationBuilder
 from samcli.lib.package.utils import make_zip
@@ -44,7 +44,7 @@ class AbstractLayerSyncFlow(SyncFlow, ABC):
         layer_identifier: str,
         build_context: "BuildContext",
         deploy_context: "DeployContext",
-        physical_id_mapping: Dict[str, str],
+        physical_id_mapping: Mapping[str, str],
         stacks: List[Stack],
     ):
         super().__init__(build_context, deploy_context, physical_id_mapping, f"Layer {layer_identifier}", stacks)
@@ -258,7 +258,7 @@ class FunctionLayerReferenceSync(SyncFlow):
         new_layer_version: int,
         build_context: "BuildContext",
         deploy_context: "DeployContext",
-        physical_id_mapping: Dict[str, str],
+        physical_id_mapping: Mapping[str, str],
         stacks: List[Stack],
     ):
         super().__init__(
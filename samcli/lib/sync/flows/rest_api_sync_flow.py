@@ -1,6 +1,6 @@
 """SyncFlow for RestApi"""
 import logging
-from typing import Dict, List, TYPE_CHECKING, Set, cast, Optional
+from typing import Dict, List, Mapping, TYPE_CHECKING, Set, cast, Optional
 
 from botocore.exceptions import ClientError
 
@@ -27,7 +27,7 @@ class RestApiSyncFlow(GenericApiSyncFlow):
         api_identifier: str,
         build_context: "BuildContext",
         deploy_context: "DeployContext",
-        physical_id_mapping: Dict[str, str],
+        physical_id_mapping: Mapping[str, str],
         stacks: List[Stack],
     ):
         """
@@ -39,7 +39,7 @@ class RestApiSyncFlow(GenericApiSyncFlow):
             BuildContext used for build related parameters
         deploy_context : BuildContext
             DeployContext used for this deploy related parameters
-        physical_id_mapping : Dict[str, str]
+        physical_id_mapping : Mapping[str, str]
             Mapping between resource logical identifier and physical identifier
         stacks : List[Stack], optional
             List of stacks containing a root stack and optional nested stacks
@@ -1,7 +1,7 @@
 """Base SyncFlow for StepFunctions"""
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, TYPE_CHECKING, cast, Optional
+from typing import Any, List, Mapping, TYPE_CHECKING, cast, Optional
 
 
 from samcli.lib.providers.provider import Stack, get_resource_by_id, ResourceIdentifier
@@ -29,7 +29,7 @@ class StepFunctionsSyncFlow(SyncFlow):
         state_machine_identifier: str,
         build_context: "BuildContext",
         deploy_context: "DeployContext",
-        physical_id_mapping: Dict[str, str],
+        physical_id_mapping: Mapping[str, str],
         stacks: List[Stack],
     ):
         """
@@ -41,7 +41,7 @@ class StepFunctionsSyncFlow(SyncFlow):
             BuildContext used for build related parameters
         deploy_context : BuildContext
             DeployContext used for this deploy related parameters
-        physical_id_mapping : Dict[str, str]
+        physical_id_mapping : Mapping[str, str]
             Mapping between resource logical identifier and physical identifier
         stacks : List[Stack], optional
             List of stacks containing a root stack and optional nested stacks
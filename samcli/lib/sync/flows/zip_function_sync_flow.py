@@ -7,7 +7,7 @@ import tempfile
 import uuid
 from contextlib import ExitStack
 
-from typing import Any, Dict, List, Optional, TYPE_CHECKING, cast
+from typing import Any, List, Mapping, Optional, TYPE_CHECKING, cast
 
 from samcli.lib.build.build_graph import BuildGraph
 from samcli.lib.providers.provider import Stack
@@ -42,7 +42,7 @@ class ZipFunctionSyncFlow(FunctionSyncFlow):
         function_identifier: str,
         build_context: "BuildContext",
         deploy_context: "DeployContext",
-        physical_id_mapping: Dict[str, str],
+        physical_id_mapping: Mapping[str, str],
         stacks: List[Stack],
     ):
 
@@ -55,7 +55,7 @@ class ZipFunctionSyncFlow(FunctionSyncFlow):
             BuildContext
         deploy_context : DeployContext
             DeployContext
-        physical_id_mapping : Dict[str, str]
+        physical_id_mapping : Mapping[str, str]
             Physical ID Mapping
         stacks : Optional[List[Stack]]
             Stacks
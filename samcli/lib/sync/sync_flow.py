@@ -4,7 +4,7 @@ import logging
 from abc import ABC, abstractmethod
 from enum import Enum
 from threading import Lock
-from typing import Any, Dict, List, NamedTuple, Optional, TYPE_CHECKING, cast
+from typing import Any, Dict, List, Mapping, NamedTuple, Optional, TYPE_CHECKING, cast
 from boto3.session import Session
 
 from samcli.lib.providers.provider import get_resource_by_id
@@ -45,14 +45,14 @@ class SyncFlow(ABC):
     _deploy_context: "DeployContext"
     _stacks: Optional[List[Stack]]
     _session: Optional[Session]
-    _physical_id_mapping: Dict[str, str]
+    _physical_id_mapping: Mapping[str, str]
     _locks: Optional[Dict[str, Lock]]
 
     def __init__(
         self,
         build_context: "BuildContext",
         deploy_context: "DeployContext",
-        physical_id_mapping: Dict[str, str],
+        physical_id_mapping: Mapping[str, str],
         log_name: str,
         stacks: Optional[List[Stack]] = None,
     ):
@@ -63,7 +63,7 @@ class SyncFlow(ABC):
             BuildContext used for build related parameters
         deploy_context : BuildContext
             DeployContext used for this deploy related parameters
-        physical_id_mapping : Dict[str, str]
+        physical_id_mapping : Mapping[str, str]
             Mapping between resource logical identifier and physical identifier
         log_name : str
             Name to be used for logging purposes
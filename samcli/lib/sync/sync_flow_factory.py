@@ -1,9 +1,17 @@
 """SyncFlow Factory for creating SyncFlows based on resource types"""
 import logging
-from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING, cast
+import threading
+from types import MappingProxyType, MethodType
+from typing import Any, Callable, Dict, FrozenSet, List, Mapping, Optional, Tuple, Type, cast, TYPE_CHECKING
 
 from samcli.lib.bootstrap.nested_stack.nested_stack_manager import NestedStackManager
-from samcli.lib.providers.provider import Stack, get_resource_by_id, ResourceIdentifier
+from samcli.lib.providers.provider import (
+    Stack,
+    ResourceIdentifier,
+    ResourceIndex,
+    build_resource_index,
+    get_resource_by_id,
+)
 from samcli.lib.samlib.resource_metadata_normalizer import ResourceMetadataNormalizer
 from samcli.lib.sync.flows.auto_dependency_layer_sync_flow import AutoDependencyLayerParentSyncFlow
 from samcli.lib.sync.flows.layer_sync_flow import LayerSyncFlow
@@ -17,7 +25,7 @@ from samcli.lib.sync.flows.image_function_sync_flow import ImageFunctionSyncFlow
 from samcli.lib.sync.flows.rest_api_sync_flow import RestApiSyncFlow
 from samcli.lib.sync.flows.http_api_sync_flow import HttpApiSyncFlow
 from samcli.lib.sync.flows.stepfunctions_sync_flow import StepFunctionsSyncFlow
-from samcli.lib.utils.boto_utils import get_boto_resource_provider_with_config
+from samcli.lib.utils.boto_utils import get_boto_client_provider_with_config
 from samcli.lib.utils.cloudformation import get_physical_id_mapping
 from samcli.lib.utils.resources import (
     AWS_SERVERLESS_FUNCTION,
@@ -38,16 +46,57 @@ if TYPE_CHECKING:  # pragma: no cover
 
 LOG = logging.getLogger(__name__)
 
+# CloudFormation clients shared between factory instances, keyed by (region, profile)
+_CFN_CLIENT_CACHE: Dict[Tuple[Optional[str], Optional[str]], Any] = {}
+_CFN_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+def _get_cfn_client(region: Optional[str], profile: Optional[str]) -> Any:
+    """
+    Returns a CloudFormation client for given region and profile, creating it only once.
+    Creating a boto3 client resolves credentials and loads service models, which is expensive.
+
+    Parameters
+    ----------
+    region : Optional[str]
+        AWS region name
+    profile : Optional[str]
+        Profile name from credentials
+
+    Returns
+    -------
+        boto3 CloudFormation client
+    """
+    key = (region, profile)
+    with _CFN_CLIENT_CACHE_LOCK:
+        client = _CFN_CLIENT_CACHE.get(key)
+        if client is None:
+            client = get_boto_client_provider_with_config(region=region, profile=profile)("cloudformation")
+            _CFN_CLIENT_CACHE[key] = client
+    return client
+
 
 class SyncFlowFactory(ResourceTypeBasedFactory[SyncFlow]):  # pylint: disable=E1136
     """Factory class for SyncFlow
     Creates appropriate SyncFlow types based on stack resource types
     """
 
+    __slots__ = (
+        "_deploy_context",
+        "_build_context",
+        "_physical_id_mapping",
+        "_auto_dependency_layer",
+        "_resource_index",
+        "_generators",
+    )
+
     _deploy_context: "DeployContext"
     _build_context: "BuildContext"
-    _physical_id_mapping: Dict[str, str]
+    # read-only view, since the same mapping is shared with every SyncFlow created by this factory
+    _physical_id_mapping: Mapping[str, str]
     _auto_dependency_layer: bool
+    _resource_index: ResourceIndex
+    _generators: Dict[str, "SyncFlowFactory.BoundGeneratorFunction"]
 
     def __init__(
         self,
@@ -70,17 +119,22 @@ class SyncFlowFactory(ResourceTypeBasedFactory[SyncFlow]):  # pylint: disable=E1
         self._deploy_context = deploy_context
         self._build_context = build_context
         self._auto_dependency_layer = auto_dependency_layer
-        self._physical_id_mapping = dict()
+        self._physical_id_mapping = MappingProxyType({})
+        self._resource_index = build_resource_index(stacks)
+        # bind generator functions once so that create_sync_flow only does a dict lookup and a call
+        self._generators = {
+            resource_type: MethodType(generator, self)
+            for resource_type, generator in self._get_generator_mapping().items()
+        }
 
     def load_physical_id_mapping(self) -> None:
         """Load physical IDs of the stack resources from remote"""
         LOG.debug("Loading physical ID mapping")
-        self._physical_id_mapping = get_physical_id_mapping(
-            get_boto_resource_provider_with_config(
-                region=self._deploy_context.region,
-                profile=self._deploy_context.profile,
-            ),
+        cfn_client = _get_cfn_client(self._deploy_context.region, self._deploy_context.profile)
+        physical_id_mapping = get_physical_id_mapping(
+            lambda _: cfn_client,
             self._deploy_context.stack_name,
+            SyncFlowFactory.SYNCABLE_RESOURCE_TYPES,
         )
 
         # extend physical id mapping to contain resource ids as well
@@ -88,7 +142,7 @@ class SyncFlowFactory(ResourceTypeBasedFactory[SyncFlow]):  # pylint: disable=E1
         for stack in self._stacks:
             # currently we care only about the root stack, as we did not load the nested stacks resources
             if stack.is_root_stack:
-                for logical_id, physical_id in self._physical_id_mapping.items():
+                for logical_id, physical_id in physical_id_mapping.items():
                     resource = stack.resources.get(logical_id, {})
                     if not resource:
                         # this means that this resource is not in the template, one example is the serverless templates
@@ -96,48 +150,52 @@ class SyncFlowFactory(ResourceTypeBasedFactory[SyncFlow]):  # pylint: disable=E1
                     resource_id = ResourceMetadataNormalizer.get_resource_id(resource, logical_id)
                     resource_id_mapping[resource_id] = physical_id
                 break
-        self._physical_id_mapping = {
-            **self._physical_id_mapping,
-            **resource_id_mapping,
-        }
+        self._physical_id_mapping = MappingProxyType(
+            {
+                **physical_id_mapping,
+                **resource_id_mapping,
+            }
+        )
+
+    # SyncFlow type for each PackageType of a lambda function
+    LAMBDA_FLOW_BY_PACKAGE_TYPE: Dict[str, Type[FunctionSyncFlow]] = {
+        ZIP: ZipFunctionSyncFlow,
+        IMAGE: ImageFunctionSyncFlow,
+    }
 
     def _create_lambda_flow(
         self, resource_identifier: ResourceIdentifier, resource: Dict[str, Any]
     ) -> Optional[FunctionSyncFlow]:
-        resource_properties = resource.get("Properties", dict())
-        package_type = resource_properties.get("PackageType", ZIP)
-        runtime = resource_properties.get("Runtime")
-        if package_type == ZIP:
-            # only return auto dependency layer sync if runtime is supported
-            if self._auto_dependency_layer and NestedStackManager.is_runtime_supported(runtime):
-                return AutoDependencyLayerParentSyncFlow(
-                    str(resource_identifier),
-                    self._build_context,
-                    self._deploy_context,
-                    self._physical_id_mapping,
-                    self._stacks,
-                )
-
-            return ZipFunctionSyncFlow(
-                str(resource_identifier),
+        resource_properties = resource.get("Properties")
+        if resource_properties:
+            package_type = resource_properties.get("PackageType", ZIP)
+            runtime = resource_properties.get("Runtime")
+        else:
+            package_type, runtime = ZIP, None
+        # only return auto dependency layer sync if runtime is supported
+        if package_type == ZIP and self._auto_dependency_layer and NestedStackManager.is_runtime_supported(runtime):
+            return AutoDependencyLayerParentSyncFlow(
+                resource_identifier.raw,
                 self._build_context,
                 self._deploy_context,
                 self._physical_id_mapping,
                 self._stacks,
             )
-        if package_type == IMAGE:
-            return ImageFunctionSyncFlow(
-                str(resource_identifier),
-                self._build_context,
-                self._deploy_context,
-                self._physical_id_mapping,
-                self._stacks,
-            )
-        return None
+
+        sync_flow_type = SyncFlowFactory.LAMBDA_FLOW_BY_PACKAGE_TYPE.get(package_type)
+        if not sync_flow_type:
+            return None
+        return sync_flow_type(
+            resource_identifier.raw,
+            self._build_context,
+            self._deploy_context,
+            self._physical_id_mapping,
+            self._stacks,
+        )
 
     def _create_layer_flow(self, resource_identifier: ResourceIdentifier, resource: Dict[str, Any]) -> SyncFlow:
         return LayerSyncFlow(
-            str(resource_identifier),
+            resource_identifier.raw,
             self._build_context,
             self._deploy_context,
             self._physical_id_mapping,
@@ -146,7 +204,7 @@ class SyncFlowFactory(ResourceTypeBasedFactory[SyncFlow]):  # pylint: disable=E1
 
     def _create_rest_api_flow(self, resource_identifier: ResourceIdentifier, resource: Dict[str, Any]) -> SyncFlow:
         return RestApiSyncFlow(
-            str(resource_identifier),
+            resource_identifier.raw,
             self._build_context,
             self._deploy_context,
             self._physical_id_mapping,
@@ -155,7 +213,7 @@ class SyncFlowFactory(ResourceTypeBasedFactory[SyncFlow]):  # pylint: disable=E1
 
     def _create_api_flow(self, resource_identifier: ResourceIdentifier, resource: Dict[str, Any]) -> SyncFlow:
         return HttpApiSyncFlow(
-            str(resource_identifier),
+            resource_identifier.raw,
             self._build_context,
             self._deploy_context,
             self._physical_id_mapping,
@@ -166,7 +224,7 @@ class SyncFlowFactory(ResourceTypeBasedFactory[SyncFlow]):  # pylint: disable=E1
         self, resource_identifier: ResourceIdentifier, resource: Dict[str, Any]
     ) -> Optional[SyncFlow]:
         return StepFunctionsSyncFlow(
-            str(resource_identifier),
+            resource_identifier.raw,
             self._build_context,
             self._deploy_context,
             self._physical_id_mapping,
@@ -174,6 +232,7 @@ class SyncFlowFactory(ResourceTypeBasedFactory[SyncFlow]):  # pylint: disable=E1
         )
 
     GeneratorFunction = Callable[["SyncFlowFactory", ResourceIdentifier, Dict[str, Any]], Optional[SyncFlow]]
+    BoundGeneratorFunction = Callable[[ResourceIdentifier, Dict[str, Any]], Optional[SyncFlow]]
     GENERATOR_MAPPING: Dict[str, GeneratorFunction] = {
         AWS_LAMBDA_FUNCTION: _create_lambda_flow,
         AWS_SERVERLESS_FUNCTION: _create_lambda_flow,
@@ -187,14 +246,20 @@ class SyncFlowFactory(ResourceTypeBasedFactory[SyncFlow]):  # pylint: disable=E1
         AWS_STEPFUNCTIONS_STATEMACHINE: _create_stepfunctions_flow,
     }
 
+    # Only resources of these types need their physical IDs resolved from the deployed stack
+    SYNCABLE_RESOURCE_TYPES: FrozenSet[str] = frozenset(GENERATOR_MAPPING)
+
     # SyncFlow mapping between resource type and creation function
     # Ignoring no-self-use as PyLint has a bug with Generic Abstract Classes
     def _get_generator_mapping(self) -> Dict[str, GeneratorFunction]:  # pylint: disable=no-self-use
         return SyncFlowFactory.GENERATOR_MAPPING
 
     def create_sync_flow(self, resource_identifier: ResourceIdentifier) -> Optional[SyncFlow]:
-        resource = get_resource_by_id(self._stacks, resource_identifier)
-        generator = self._get_generator_function(resource_identifier)
-        if not generator or not resource:
+        resource_type = self._get_resource_type(resource_identifier, self._resource_index)
+        if not resource_type:
+            return None
+        generator = self._generators.get(resource_type, None)
+        if not generator:
             return None
-        return cast(SyncFlowFactory.GeneratorFunction, generator)(self, resource_identifier, resource)
+        resource = get_resource_by_id(self._stacks, resource_identifier, index=self._resource_index)
+        return generator(resource_identifier, cast(Dict[str, Any], resource))
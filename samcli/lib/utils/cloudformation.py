@@ -3,7 +3,8 @@ This utility file contains methods to read information from certain CFN stack
 """
 import logging
 import posixpath
-from typing import Dict, Set, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import AbstractSet, Any, Dict, List, Optional, Tuple
 
 from attr import dataclass
 from botocore.exceptions import ClientError
@@ -13,6 +14,9 @@ from samcli.lib.utils.resources import AWS_CLOUDFORMATION_STACK
 
 LOG = logging.getLogger(__name__)
 
+# maximum number of nested stacks which will have their resources listed at the same time
+MAX_NESTED_STACK_WORKERS = 8
+
 
 @dataclass
 class CloudFormationResourceSummary:
@@ -26,7 +30,7 @@ class CloudFormationResourceSummary:
 
 
 def get_physical_id_mapping(
-    boto_resource_provider: BotoProviderType, stack_name: str, resource_types: Optional[Set[str]] = None
+    boto_client_provider: BotoProviderType, stack_name: str, resource_types: Optional[AbstractSet[str]] = None
 ) -> Dict[str, str]:
     """
     Uses get_resource_summaries method to gather resource summaries and creates a dictionary which contains
@@ -34,11 +38,11 @@ def get_physical_id_mapping(
 
     Parameters
     ----------
-    boto_resource_provider : BotoProviderType
-        A callable which will return boto3 resource
+    boto_client_provider : BotoProviderType
+        A callable which will return boto3 client
     stack_name : str
         Name of the stack which is deployed to CFN
-    resource_types : Optional[Set[str]]
+    resource_types : Optional[AbstractSet[str]]
         List of resource types, which will filter the results
 
     Returns
@@ -46,7 +50,7 @@ def get_physical_id_mapping(
         Dictionary of string, string which will contain logical_id to physical_id mapping
 
     """
-    resource_summaries = get_resource_summaries(boto_resource_provider, stack_name, resource_types)
+    resource_summaries = get_resource_summaries(boto_client_provider, stack_name, resource_types)
 
     resource_physical_id_map: Dict[str, str] = {}
     for resource_key, resource_summary in resource_summaries.items():
@@ -56,21 +60,23 @@ def get_physical_id_mapping(
 
 
 def get_resource_summaries(
-    boto_resource_provider: BotoProviderType,
+    boto_client_provider: BotoProviderType,
     stack_name: str,
-    resource_types: Optional[Set[str]] = None,
+    resource_types: Optional[AbstractSet[str]] = None,
     nested_stack_prefix: Optional[str] = None,
 ) -> Dict[str, CloudFormationResourceSummary]:
     """
-    Collects information about CFN resources and return their summary as list
+    Collects information about CFN resources and return their summary as list.
+    ListStackResources is paginated, so stacks with more than 100 resources are fully enumerated.
+    Nested stacks which are on the same level are fetched concurrently.
 
     Parameters
     ----------
-    boto_resource_provider : BotoProviderType
-        A callable which will return boto3 resource
+    boto_client_provider : BotoProviderType
+        A callable which will return boto3 client
     stack_name : str
         Name of the stack which is deployed to CFN
-    resource_types : Optional[Set[str]]
+    resource_types : Optional[AbstractSet[str]]
         List of resource types, which will filter the results
     nested_stack_prefix: Optional[str]
         This will contain logical id of the parent stack. So that ChildStackA/GrandChildStackB so that resources
@@ -81,28 +87,84 @@ def get_resource_summaries(
         List of CloudFormationResourceSummary which contains information about resources in the given stack
 
     """
-    LOG.debug("Fetching stack (%s) resources", stack_name)
-    cfn_resource_summaries = boto_resource_provider("cloudformation").Stack(stack_name).resource_summaries.all()
+    # boto3 clients are thread safe while sessions are not, create the client once and share it between workers
+    cfn_client = boto_client_provider("cloudformation")
     resource_summaries: Dict[str, CloudFormationResourceSummary] = {}
 
+    # pairs of stack name and the nested stack prefix of its resources
+    stacks_to_fetch: List[Tuple[str, Optional[str]]] = [(stack_name, nested_stack_prefix)]
+    # only started once there is more than one stack to fetch at the same level
+    executor: Optional[ThreadPoolExecutor] = None
+    try:
+        while stacks_to_fetch:
+            if len(stacks_to_fetch) == 1:
+                fetched_stacks = [_list_stack_resources(cfn_client, stacks_to_fetch[0][0])]
+            else:
+                if not executor:
+                    executor = ThreadPoolExecutor(max_workers=MAX_NESTED_STACK_WORKERS)
+                fetched_stacks = list(
+                    executor.map(lambda stack: _list_stack_resources(cfn_client, stack[0]), stacks_to_fetch)
+                )
+
+            nested_stacks_to_fetch: List[Tuple[str, Optional[str]]] = []
+            for (_, stack_prefix), cfn_resource_summaries in zip(stacks_to_fetch, fetched_stacks):
+                stack_resource_summaries, stack_nested_stacks = _get_stack_resource_summaries(
+                    cfn_resource_summaries, stack_prefix, resource_types
+                )
+                resource_summaries.update(stack_resource_summaries)
+                nested_stacks_to_fetch.extend(stack_nested_stacks)
+            stacks_to_fetch = nested_stacks_to_fetch
+    finally:
+        if executor:
+            executor.shutdown()
+
+    return resource_summaries
+
+
+def _get_stack_resource_summaries(
+    cfn_resource_summaries: List[Dict[str, Any]],
+    stack_prefix: Optional[str],
+    resource_types: Optional[AbstractSet[str]],
+) -> Tuple[Dict[str, CloudFormationResourceSummary], List[Tuple[str, Optional[str]]]]:
+    """
+    Converts StackResourceSummaries of a single stack into CloudFormationResourceSummary instances
+
+    Parameters
+    ----------
+    cfn_resource_summaries : List[Dict[str, Any]]
+        StackResourceSummaries returned by ListStackResources
+    stack_prefix : Optional[str]
+        Nested stack prefix of the resources in this stack
+    resource_types : Optional[AbstractSet[str]]
+        List of resource types, which will filter the results
+
+    Returns
+    -------
+        Resource summaries keyed by their prefixed logical ID, and pairs of physical ID and nested stack prefix
+        for the nested stacks which should be fetched next
+    """
+    resource_summaries: Dict[str, CloudFormationResourceSummary] = {}
+    nested_stacks: List[Tuple[str, Optional[str]]] = []
     for cfn_resource_summary in cfn_resource_summaries:
         resource_summary = CloudFormationResourceSummary(
-            cfn_resource_summary.resource_type,
-            cfn_resource_summary.logical_resource_id,
-            cfn_resource_summary.physical_resource_id,
+            cfn_resource_summary["ResourceType"],
+            cfn_resource_summary["LogicalResourceId"],
+            cfn_resource_summary.get("PhysicalResourceId", ""),
         )
+        resource_key = resource_summary.logical_resource_id
+        if stack_prefix:
+            resource_key = posixpath.join(stack_prefix, resource_key)
+
         if resource_summary.resource_type == AWS_CLOUDFORMATION_STACK:
-            new_nested_stack_prefix = resource_summary.logical_resource_id
-            if nested_stack_prefix:
-                new_nested_stack_prefix = posixpath.join(nested_stack_prefix, new_nested_stack_prefix)
-            resource_summaries.update(
-                get_resource_summaries(
-                    boto_resource_provider,
-                    resource_summary.physical_resource_id,
-                    resource_types,
-                    new_nested_stack_prefix,
+            if resource_summary.physical_resource_id:
+                nested_stacks.append((resource_summary.physical_resource_id, resource_key))
+            else:
+                # nested stack hasn't been created yet, there is nothing to list under it
+                LOG.debug(
+                    "Skipping nested stack %s since it doesn't have a physical ID",
+                    resource_summary.logical_resource_id,
                 )
-            )
+
         if resource_types and resource_summary.resource_type not in resource_types:
             LOG.debug(
                 "Skipping resource %s since its type %s is not supported. Supported types %s",
@@ -112,22 +174,38 @@ def get_resource_summaries(
             )
             continue
 
-        resource_key = resource_summary.logical_resource_id
-        if nested_stack_prefix:
-            resource_key = posixpath.join(nested_stack_prefix, resource_key)
         resource_summaries[resource_key] = resource_summary
+    return resource_summaries, nested_stacks
 
-    return resource_summaries
+
+def _list_stack_resources(cfn_client: Any, stack_name: str) -> List[Dict[str, Any]]:
+    """
+    Returns all resource summaries of a single stack by going through all pages of ListStackResources
+
+    Parameters
+    ----------
+    cfn_client : Any
+        boto3 CloudFormation client
+    stack_name : str
+        Name of the stack which is deployed to CFN
+
+    Returns
+    -------
+        List of StackResourceSummaries returned by ListStackResources
+    """
+    LOG.debug("Fetching stack (%s) resources", stack_name)
+    paginator = cfn_client.get_paginator("list_stack_resources")
+    return [summary for page in paginator.paginate(StackName=stack_name) for summary in page["StackResourceSummaries"]]
 
 
-def get_resource_summary(boto_resource_provider: BotoProviderType, stack_name: str, resource_logical_id: str):
+def get_resource_summary(boto_client_provider: BotoProviderType, stack_name: str, resource_logical_id: str):
     """
     Returns resource summary of given single resource with its logical id
 
     Parameters
     ----------
-    boto_resource_provider : BotoProviderType
-        A callable which will return boto3 resource
+    boto_client_provider : BotoProviderType
+        A callable which will return boto3 client
     stack_name : str
         Name of the stack which is deployed to CFN
     resource_logical_id : str
@@ -138,12 +216,14 @@ def get_resource_summary(boto_resource_provider: BotoProviderType, stack_name: s
         CloudFormationResourceSummary of the resource which is identified by given logical id
     """
     try:
-        cfn_resource_summary = boto_resource_provider("cloudformation").StackResource(stack_name, resource_logical_id)
+        cfn_resource_summary = boto_client_provider("cloudformation").describe_stack_resource(
+            StackName=stack_name, LogicalResourceId=resource_logical_id
+        )["StackResourceDetail"]
 
         return CloudFormationResourceSummary(
-            cfn_resource_summary.resource_type,
-            cfn_resource_summary.logical_resource_id,
-            cfn_resource_summary.physical_resource_id,
+            cfn_resource_summary["ResourceType"],
+            cfn_resource_summary["LogicalResourceId"],
+            cfn_resource_summary.get("PhysicalResourceId", ""),
         )
     except ClientError as e:
         LOG.error(
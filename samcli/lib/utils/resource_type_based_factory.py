@@ -3,7 +3,7 @@ import logging
 from abc import ABC, abstractmethod
 from typing import Callable, Dict, Generic, List, Optional, TypeVar
 
-from samcli.lib.providers.provider import ResourceIdentifier, Stack, get_resource_by_id
+from samcli.lib.providers.provider import ResourceIdentifier, ResourceIndex, Stack, get_resource_by_id
 
 LOG = logging.getLogger(__name__)
 
@@ -11,6 +11,9 @@ T = TypeVar("T")  # pylint: disable=invalid-name
 
 
 class ResourceTypeBasedFactory(ABC, Generic[T]):
+    # allows subclasses to define __slots__ without getting an instance __dict__
+    __slots__ = ("_stacks",)
+
     def __init__(self, stacks: List[Stack]) -> None:
         self._stacks = stacks
 
@@ -24,19 +27,23 @@ class ResourceTypeBasedFactory(ABC, Generic[T]):
         """
         raise NotImplementedError()
 
-    def _get_resource_type(self, resource_identifier: ResourceIdentifier) -> Optional[str]:
+    def _get_resource_type(
+        self, resource_identifier: ResourceIdentifier, resource_index: Optional[ResourceIndex] = None
+    ) -> Optional[str]:
         """Get resource type of the resource
 
         Parameters
         ----------
         resource_identifier : ResourceIdentifier
+        resource_index : Optional[ResourceIndex]
+            Index of the stacks to look the resource up from, stacks are searched if it is not given
 
         Returns
         -------
         Optional[str]
             Resource type of the resource
         """
-        resource = get_resource_by_id(self._stacks, resource_identifier)
+        resource = get_resource_by_id(self._stacks, resource_identifier, index=resource_index)
         if not resource:
             LOG.debug("Resource %s does not exist.", str(resource_identifier))
             return None
@@ -47,13 +54,17 @@ class ResourceTypeBasedFactory(ABC, Generic[T]):
             return None
         return resource_type
 
-    def _get_generator_function(self, resource_identifier: ResourceIdentifier) -> Optional[Callable]:
+    def _get_generator_function(
+        self, resource_identifier: ResourceIdentifier, resource_index: Optional[ResourceIndex] = None
+    ) -> Optional[Callable]:
         """Create an appropriate T object based on stack resource type
 
         Parameters
         ----------
         resource_identifier : ResourceIdentifier
             Resource identifier of the resource
+        resource_index : Optional[ResourceIndex]
+            Index of the stacks to look the resource up from, stacks are searched if it is not given
 
         Returns
         -------
@@ -61,7 +72,7 @@ class ResourceTypeBasedFactory(ABC, Generic[T]):
             Object T for the resource. Returns None if resource cannot be
             found or have no associating T generator function.
         """
-        resource_type = self._get_resource_type(resource_identifier)
+        resource_type = self._get_resource_type(resource_identifier, resource_index)
         if not resource_type:
             LOG.debug("Resource %s has invalid property Type.", str(resource_identifier))
             return None
@@ -1,5 +1,8 @@
 import os
 import posixpath
+from copy import deepcopy
+from dataclasses import dataclass
+from typing import Any, Dict
 from unittest import TestCase
 from unittest.mock import MagicMock, Mock, patch
 
@@ -12,6 +15,8 @@ from samcli.lib.providers.provider import (
     ResourceIdentifier,
     Stack,
     _get_build_dir,
+    build_resource_index,
+    build_type_index,
     get_all_resource_ids,
     get_resource_by_id,
     get_resource_ids_by_type,
@@ -26,6 +31,14 @@ from samcli.commands.local.cli_common.user_exceptions import (
 )
 
 
+@dataclass
+class _StackStub:
+    """Lightweight replacement of Stack, only providing what the resource lookup functions use"""
+
+    stack_path: str
+    resources: Dict[str, Any]
+
+
 def make_resource(stack_path, name):
     resource = Mock()
     resource.stack_path = stack_path
@@ -481,6 +494,24 @@ class TestResourceIdentifier(TestCase):
     def test_str(self, resource_identifier_string):
         resource_identifier = ResourceIdentifier(resource_identifier_string)
         self.assertEqual(str(resource_identifier), resource_identifier_string)
+        self.assertEqual(resource_identifier.raw, resource_identifier_string)
+
+    def test_of_returns_shared_instance(self):
+        resource_identifier = ResourceIdentifier.of("NestedStack1/Function1")
+        self.assertIs(resource_identifier, ResourceIdentifier.of("NestedStack1/Function1"))
+        self.assertEqual(resource_identifier, ResourceIdentifier("NestedStack1/Function1"))
+
+    def test_no_instance_dict(self):
+        resource_identifier = ResourceIdentifier("NestedStack1/Function1")
+        self.assertFalse(hasattr(resource_identifier, "__dict__"))
+        with self.assertRaises(AttributeError):
+            resource_identifier.new_attribute = "value"
+
+    def test_raw_is_read_only(self):
+        resource_identifier = ResourceIdentifier.of("NestedStack1/Function1")
+        with self.assertRaises(AttributeError):
+            resource_identifier.raw = "NestedStack1/Function2"
+        self.assertEqual(ResourceIdentifier.of("NestedStack1/Function1").raw, "NestedStack1/Function1")
 
 
 @parameterized_class(["is_cdk"], [[False], [True]])
@@ -489,21 +520,24 @@ class TestGetResourceByID(TestCase):
 
     def setUp(self) -> None:
         super().setUp()
-        self.root_stack = MagicMock()
-        self.root_stack.stack_path = ""
-        self.root_stack.resources = {"Function1": {"Properties": "Body1"}}
+        self.root_stack = _StackStub(
+            stack_path="",
+            resources={"Function1": {"Properties": "Body1"}},
+        )
         if self.is_cdk:
             self.root_stack.resources["Function1"]["Metadata"] = {"SamResourceId": "CDKFunction1"}
 
-        self.nested_stack = MagicMock()
-        self.nested_stack.stack_path = "NestedStack1"
-        self.nested_stack.resources = {"Function1": {"Properties": "Body2"}}
+        self.nested_stack = _StackStub(
+            stack_path="NestedStack1",
+            resources={"Function1": {"Properties": "Body2"}},
+        )
         if self.is_cdk:
             self.nested_stack.resources["Function1"]["Metadata"] = {"SamResourceId": "CDKFunction1"}
 
-        self.nested_nested_stack = MagicMock()
-        self.nested_nested_stack.stack_path = "NestedStack1/NestedNestedStack1"
-        self.nested_nested_stack.resources = {"Function2": {"Properties": "Body3"}}
+        self.nested_nested_stack = _StackStub(
+            stack_path="NestedStack1/NestedNestedStack1",
+            resources={"Function2": {"Properties": "Body3"}},
+        )
         if self.is_cdk:
             self.nested_nested_stack.resources["Function2"]["Metadata"] = {"SamResourceId": "CDKFunction2"}
 
@@ -606,29 +640,102 @@ class TestGetResourceByID(TestCase):
         self.assertEqual(result, None)
 
 
+@parameterized_class(["is_cdk"], [[False], [True]])
+class TestBuildResourceIndex(TestCase):
+    is_cdk = False
+
+    def setUp(self) -> None:
+        super().setUp()
+        root_stack = _StackStub(
+            stack_path="",
+            resources={"Function1": {"Properties": "Body1"}},
+        )
+
+        nested_stack = _StackStub(
+            stack_path="NestedStack1",
+            resources={"Function1": {"Properties": "Body2"}},
+        )
+
+        nested_nested_stack = _StackStub(
+            stack_path="NestedStack1/NestedNestedStack1",
+            resources={"Function2": {"Properties": "Body3"}},
+        )
+
+        if self.is_cdk:
+            root_stack.resources["Function1"]["Metadata"] = {"SamResourceId": "CDKFunction1"}
+            nested_stack.resources["Function1"]["Metadata"] = {"SamResourceId": "CDKFunction1"}
+            nested_nested_stack.resources["Function2"]["Metadata"] = {"SamResourceId": "CDKFunction2"}
+
+        self.stacks = [root_stack, nested_stack, nested_nested_stack]
+
+    @parameterized.expand(
+        [
+            ("Function1",),
+            ("CDKFunction1",),
+            ("Function2",),
+            ("CDKFunction2",),
+            ("NestedStack1/Function1",),
+            ("NestedStack1/CDKFunction1",),
+            ("NestedStack1/NestedNestedStack1/Function2",),
+            ("NestedStack1/NestedNestedStack1/CDKFunction2",),
+            ("NestedStack1/Function2",),
+            ("Function3",),
+        ]
+    )
+    def test_index_matches_get_resource_by_id(self, resource_identifier_string):
+        resource_identifier = ResourceIdentifier(resource_identifier_string)
+        resource_index = build_resource_index(self.stacks)
+        self.assertIs(resource_index.get(resource_identifier), get_resource_by_id(self.stacks, resource_identifier))
+
+    @parameterized.expand([("Function1",), ("CDKFunction1",), ("NestedStack1/Function1",), ("Function3",)])
+    def test_get_resource_by_id_with_index(self, resource_identifier_string):
+        resource_identifier = ResourceIdentifier(resource_identifier_string)
+        resource_index = MagicMock()
+        result = get_resource_by_id(self.stacks, resource_identifier, index=resource_index)
+        self.assertIs(result, resource_index.get.return_value)
+        resource_index.get.assert_called_once_with(resource_identifier)
+
+    def test_get_resource_by_id_explicit_nested_ignores_index(self):
+        resource_identifier = ResourceIdentifier("Function2")
+        resource_index = build_resource_index(self.stacks)
+        self.assertIsNotNone(resource_index.get(resource_identifier))
+        self.assertIsNone(get_resource_by_id(self.stacks, resource_identifier, True, resource_index))
+
+    def test_resources_are_not_modified(self):
+        resource_type = "".join(["AWS::Lambda::", "Function"])
+        self.stacks[0].resources["Function1"]["Type"] = resource_type
+        resources_before = deepcopy([stack.resources for stack in self.stacks])
+        build_resource_index(self.stacks)
+        self.assertEqual([stack.resources for stack in self.stacks], resources_before)
+        self.assertIs(self.stacks[0].resources["Function1"]["Type"], resource_type)
+
+
 class TestGetResourceIDsByType(TestCase):
     def setUp(self) -> None:
         super().setUp()
-        self.root_stack = MagicMock()
-        self.root_stack.stack_path = ""
-        self.root_stack.resources = {
-            "Function1": {"Type": "TypeA"},
-            "CDKFunction1": {"Type": "TypeA", "Metadata": {"SamResourceId": "CDKFunction1-x"}},
-        }
+        self.root_stack = _StackStub(
+            stack_path="",
+            resources={
+                "Function1": {"Type": "TypeA"},
+                "CDKFunction1": {"Type": "TypeA", "Metadata": {"SamResourceId": "CDKFunction1-x"}},
+            },
+        )
 
-        self.nested_stack = MagicMock()
-        self.nested_stack.stack_path = "NestedStack1"
-        self.nested_stack.resources = {
-            "Function1": {"Type": "TypeA"},
-            "CDKFunction1": {"Type": "TypeA", "Metadata": {"SamResourceId": "CDKFunction1-x"}},
-        }
+        self.nested_stack = _StackStub(
+            stack_path="NestedStack1",
+            resources={
+                "Function1": {"Type": "TypeA"},
+                "CDKFunction1": {"Type": "TypeA", "Metadata": {"SamResourceId": "CDKFunction1-x"}},
+            },
+        )
 
-        self.nested_nested_stack = MagicMock()
-        self.nested_nested_stack.stack_path = "NestedStack1/NestedNestedStack1"
-        self.nested_nested_stack.resources = {
-            "Function2": {"Type": "TypeB"},
-            "CDKFunction2": {"Type": "TypeC", "Metadata": {"SamResourceId": "CDKFunction2-x"}},
-        }
+        self.nested_nested_stack = _StackStub(
+            stack_path="NestedStack1/NestedNestedStack1",
+            resources={
+                "Function2": {"Type": "TypeB"},
+                "CDKFunction2": {"Type": "TypeC", "Metadata": {"SamResourceId": "CDKFunction2-x"}},
+            },
+        )
 
     def test_get_resource_ids_by_type_single_nested(
         self,
@@ -656,30 +763,45 @@ class TestGetResourceIDsByType(TestCase):
             ],
         )
 
+    def test_build_type_index(self):
+        stacks = [self.root_stack, self.nested_stack, self.nested_nested_stack]
+        result = build_type_index(stacks)
+        self.assertEqual(result.keys(), {"TypeA", "TypeB", "TypeC"})
+        for resource_type, resource_ids in result.items():
+            self.assertEqual(resource_ids, get_resource_ids_by_type(stacks, resource_type))
+
+    def test_build_type_index_with_resource_types(self):
+        stacks = [self.root_stack, self.nested_stack, self.nested_nested_stack]
+        result = build_type_index(stacks, ["TypeA", "TypeD"])
+        self.assertEqual(result, {"TypeA": get_resource_ids_by_type(stacks, "TypeA")})
+
 
 class TestGetAllResourceIDs(TestCase):
     def setUp(self) -> None:
         super().setUp()
-        self.root_stack = MagicMock()
-        self.root_stack.stack_path = ""
-        self.root_stack.resources = {
-            "Function1": {"Type": "TypeA"},
-            "CDKFunction1": {"Type": "TypeA", "Metadata": {"SamResourceId": "CDKFunction1-x"}},
-        }
+        self.root_stack = _StackStub(
+            stack_path="",
+            resources={
+                "Function1": {"Type": "TypeA"},
+                "CDKFunction1": {"Type": "TypeA", "Metadata": {"SamResourceId": "CDKFunction1-x"}},
+            },
+        )
 
-        self.nested_stack = MagicMock()
-        self.nested_stack.stack_path = "NestedStack1"
-        self.nested_stack.resources = {
-            "Function1": {"Type": "TypeA"},
-            "CDKFunction1": {"Type": "TypeA", "Metadata": {"SamResourceId": "CDKFunction1-x"}},
-        }
+        self.nested_stack = _StackStub(
+            stack_path="NestedStack1",
+            resources={
+                "Function1": {"Type": "TypeA"},
+                "CDKFunction1": {"Type": "TypeA", "Metadata": {"SamResourceId": "CDKFunction1-x"}},
+            },
+        )
 
-        self.nested_nested_stack = MagicMock()
-        self.nested_nested_stack.stack_path = "NestedStack1/NestedNestedStack1"
-        self.nested_nested_stack.resources = {
-            "Function2": {"Type": "TypeB"},
-            "CDKFunction2": {"Type": "TypeC", "Metadata": {"SamResourceId": "CDKFunction2-x"}},
-        }
+        self.nested_nested_stack = _StackStub(
+            stack_path="NestedStack1/NestedNestedStack1",
+            resources={
+                "Function2": {"Type": "TypeB"},
+                "CDKFunction2": {"Type": "TypeC", "Metadata": {"SamResourceId": "CDKFunction2-x"}},
+            },
+        )
 
     def test_get_all_resource_ids(
         self,
@@ -703,33 +825,37 @@ class TestGetUniqueResourceIDs(TestCase):
         super().setUp()
         self.stacks = MagicMock()
 
-    @patch("samcli.lib.providers.provider.get_resource_ids_by_type")
-    def test_only_resource_ids(self, get_resource_ids_by_type_mock):
+    @patch("samcli.lib.providers.provider.build_type_index")
+    def test_only_resource_ids(self, build_type_index_mock):
         resource_ids = ["Function1", "Function2"]
         resource_types = []
-        get_resource_ids_by_type_mock.return_value = {}
+        build_type_index_mock.return_value = {}
         result = get_unique_resource_ids(self.stacks, resource_ids, resource_types)
-        get_resource_ids_by_type_mock.assert_not_called()
+        build_type_index_mock.assert_not_called()
         self.assertEqual(result, {ResourceIdentifier("Function1"), ResourceIdentifier("Function2")})
 
-    @patch("samcli.lib.providers.provider.get_resource_ids_by_type")
-    def test_only_resource_types(self, get_resource_ids_by_type_mock):
+    @patch("samcli.lib.providers.provider.build_type_index")
+    def test_only_resource_types(self, build_type_index_mock):
         resource_ids = []
         resource_types = ["Type1", "Type2"]
-        get_resource_ids_by_type_mock.return_value = {ResourceIdentifier("Function1"), ResourceIdentifier("Function2")}
+        build_type_index_mock.return_value = {
+            "Type1": [ResourceIdentifier("Function1")],
+            "Type2": [ResourceIdentifier("Function2")],
+            "Type3": [ResourceIdentifier("Function3")],
+        }
         result = get_unique_resource_ids(self.stacks, resource_ids, resource_types)
-        get_resource_ids_by_type_mock.assert_any_call(self.stacks, "Type1")
-        get_resource_ids_by_type_mock.assert_any_call(self.stacks, "Type2")
+        build_type_index_mock.assert_called_once_with(self.stacks, resource_types)
         self.assertEqual(result, {ResourceIdentifier("Function1"), ResourceIdentifier("Function2")})
 
-    @patch("samcli.lib.providers.provider.get_resource_ids_by_type")
-    def test_duplicates(self, get_resource_ids_by_type_mock):
+    @patch("samcli.lib.providers.provider.build_type_index")
+    def test_duplicates(self, build_type_index_mock):
         resource_ids = ["Function1", "Function2"]
         resource_types = ["Type1", "Type2"]
-        get_resource_ids_by_type_mock.return_value = {ResourceIdentifier("Function2"), ResourceIdentifier("Function3")}
+        build_type_index_mock.return_value = {
+            "Type1": [ResourceIdentifier("Function2"), ResourceIdentifier("Function3")],
+        }
         result = get_unique_resource_ids(self.stacks, resource_ids, resource_types)
-        get_resource_ids_by_type_mock.assert_any_call(self.stacks, "Type1")
-        get_resource_ids_by_type_mock.assert_any_call(self.stacks, "Type2")
+        build_type_index_mock.assert_called_once_with(self.stacks, resource_types)
         self.assertEqual(
             result, {ResourceIdentifier("Function1"), ResourceIdentifier("Function2"), ResourceIdentifier("Function3")}
         )
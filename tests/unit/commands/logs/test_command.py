@@ -30,14 +30,12 @@ class TestLogsCliCommand(TestCase):
     @patch("samcli.commands.logs.logs_context.ResourcePhysicalIdResolver")
     @patch("samcli.commands.logs.logs_context.parse_time")
     @patch("samcli.lib.utils.boto_utils.get_boto_client_provider_with_config")
-    @patch("samcli.lib.utils.boto_utils.get_boto_resource_provider_with_config")
     def test_logs_command(
         self,
         tailing,
         include_tracing,
         cw_log_group,
         output,
-        patched_boto_resource_provider,
         patched_boto_client_provider,
         patched_parse_time,
         patched_resource_physical_id_resolver,
@@ -60,9 +58,6 @@ class TestLogsCliCommand(TestCase):
         mocked_client_provider = Mock()
         patched_boto_client_provider.return_value = mocked_client_provider
 
-        mocked_resource_provider = Mock()
-        patched_boto_resource_provider.return_value = mocked_resource_provider
-
         do_cli(
             self.function_name,
             self.stack_name,
@@ -85,10 +80,9 @@ class TestLogsCliCommand(TestCase):
         )
 
         patched_boto_client_provider.assert_called_with(region=self.region, profile=self.profile)
-        patched_boto_resource_provider.assert_called_with(region=self.region, profile=self.profile)
 
         patched_resource_physical_id_resolver.assert_called_with(
-            mocked_resource_provider, self.stack_name, self.function_name
+            mocked_client_provider, self.stack_name, self.function_name
         )
 
         fetch_param = not bool(len(cw_log_group))
@@ -1,4 +1,6 @@
 import os
+import shutil
+import tempfile
 from unittest import TestCase
 from unittest.mock import Mock, patch, ANY, call
 
@@ -135,15 +137,17 @@ class TestNestedStackManager(TestCase):
         app_build_result = ApplicationBuildResult(build_graph, {"MyFunction": "path/to/build/dir"})
         patched_isdir.return_value = True
 
-        nested_stack_manager = NestedStackManager(
-            self.stack, self.stack_name, self.build_dir, template, app_build_result
-        )
+        # layer folder is created under the build dir, keep it out of the working directory
+        build_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, build_dir)
+
+        nested_stack_manager = NestedStackManager(self.stack, self.stack_name, build_dir, template, app_build_result)
 
         with patch.object(nested_stack_manager, "_add_layer_readme_info") as patched_add_readme:
             result = nested_stack_manager.generate_auto_dependency_layer_stack()
 
             patched_move_template.assert_called_with(
-                self.stack.location, os.path.join(self.build_dir, "adl_nested_template.yaml"), ANY
+                self.stack.location, os.path.join(build_dir, "adl_nested_template.yaml"), ANY
             )
             self.assertNotEqual(template, result)
 
@@ -1,12 +1,28 @@
+from types import MappingProxyType
 from unittest import TestCase
-from unittest.mock import MagicMock, patch, Mock
+from unittest.mock import ANY, MagicMock, patch, Mock
 
+from samcli.lib.providers.provider import ResourceIdentifier
+from samcli.lib.sync import sync_flow_factory
 from samcli.lib.sync.sync_flow_factory import SyncFlowFactory
+from samcli.lib.utils.packagetype import ZIP, IMAGE
+from samcli.lib.utils.resources import AWS_LAMBDA_FUNCTION, AWS_SERVERLESS_LAYERVERSION
 
 
 class TestSyncFlowFactory(TestCase):
+    def setUp(self):
+        sync_flow_factory._CFN_CLIENT_CACHE.clear()
+        self.zip_function_mock = MagicMock()
+        self.image_function_mock = MagicMock()
+        lambda_flow_patch = patch.dict(
+            SyncFlowFactory.LAMBDA_FLOW_BY_PACKAGE_TYPE, {ZIP: self.zip_function_mock, IMAGE: self.image_function_mock}
+        )
+        lambda_flow_patch.start()
+        self.addCleanup(lambda_flow_patch.stop)
+
     def create_factory(self, auto_dependency_layer: bool = False):
         stack_resource = MagicMock()
+        stack_resource.stack_path = ""
         stack_resource.resources = {
             "Resource1": {
                 "Type": "TypeA",
@@ -22,15 +38,15 @@ class TestSyncFlowFactory(TestCase):
         }
         factory = SyncFlowFactory(
             build_context=MagicMock(),
-            deploy_context=MagicMock(),
+            deploy_context=MagicMock(region="us-east-1", profile="default"),
             stacks=[stack_resource, MagicMock()],
             auto_dependency_layer=auto_dependency_layer,
         )
         return factory
 
     @patch("samcli.lib.sync.sync_flow_factory.get_physical_id_mapping")
-    @patch("samcli.lib.sync.sync_flow_factory.get_boto_resource_provider_with_config")
-    def test_load_physical_id_mapping(self, get_boto_resource_provider_mock, get_physical_id_mapping_mock):
+    @patch("samcli.lib.sync.sync_flow_factory.get_boto_client_provider_with_config")
+    def test_load_physical_id_mapping(self, get_boto_client_provider_mock, get_physical_id_mapping_mock):
         get_physical_id_mapping_mock.return_value = {"Resource1": "PhysicalResource1", "Resource2": "PhysicalResource2"}
 
         factory = self.create_factory()
@@ -41,113 +57,137 @@ class TestSyncFlowFactory(TestCase):
             factory._physical_id_mapping,
             {"Resource1": "PhysicalResource1", "Resource2": "PhysicalResource2", "CDKResource2": "PhysicalResource2"},
         )
+        get_physical_id_mapping_mock.assert_called_once_with(
+            ANY, factory._deploy_context.stack_name, SyncFlowFactory.SYNCABLE_RESOURCE_TYPES
+        )
+        self.assertIsInstance(factory._physical_id_mapping, MappingProxyType)
+        with self.assertRaises(TypeError):
+            factory._physical_id_mapping["Resource1"] = "OtherPhysicalResource"
+
+    @patch("samcli.lib.sync.sync_flow_factory.get_physical_id_mapping")
+    @patch("samcli.lib.sync.sync_flow_factory.get_boto_client_provider_with_config")
+    def test_load_physical_id_mapping_reuses_client(self, get_boto_client_provider_mock, get_physical_id_mapping_mock):
+        get_physical_id_mapping_mock.return_value = {}
 
-    @patch("samcli.lib.sync.sync_flow_factory.ImageFunctionSyncFlow")
-    @patch("samcli.lib.sync.sync_flow_factory.ZipFunctionSyncFlow")
-    def test_create_lambda_flow_zip(self, zip_function_mock, image_function_mock):
+        self.create_factory().load_physical_id_mapping()
+        self.create_factory().load_physical_id_mapping()
+
+        get_boto_client_provider_mock.assert_called_once()
+        get_boto_client_provider_mock.return_value.assert_called_once_with("cloudformation")
+        client_provider = get_physical_id_mapping_mock.call_args[0][0]
+        self.assertEqual(client_provider("cloudformation"), get_boto_client_provider_mock.return_value.return_value)
+
+    def test_create_lambda_flow_zip(self):
         factory = self.create_factory()
         resource = {"Properties": {"PackageType": "Zip"}}
-        result = factory._create_lambda_flow("Function1", resource)
-        self.assertEqual(result, zip_function_mock.return_value)
+        result = factory._create_lambda_flow(ResourceIdentifier("Function1"), resource)
+        self.assertEqual(result, self.zip_function_mock.return_value)
+        self.zip_function_mock.assert_called_once_with(
+            "Function1",
+            factory._build_context,
+            factory._deploy_context,
+            factory._physical_id_mapping,
+            factory._stacks,
+        )
 
-    @patch("samcli.lib.sync.sync_flow_factory.ImageFunctionSyncFlow")
-    @patch("samcli.lib.sync.sync_flow_factory.ZipFunctionSyncFlow")
     @patch("samcli.lib.sync.sync_flow_factory.AutoDependencyLayerParentSyncFlow")
-    def test_create_lambda_flow_zip_with_auto_dependency_layer(
-        self, auto_dependency_layer_mock, zip_function_mock, image_function_mock
-    ):
+    def test_create_lambda_flow_zip_with_auto_dependency_layer(self, auto_dependency_layer_mock):
         factory = self.create_factory(True)
         resource = {"Properties": {"PackageType": "Zip", "Runtime": "python3.8"}}
-        result = factory._create_lambda_flow("Function1", resource)
+        result = factory._create_lambda_flow(ResourceIdentifier("Function1"), resource)
         self.assertEqual(result, auto_dependency_layer_mock.return_value)
 
-    @patch("samcli.lib.sync.sync_flow_factory.ImageFunctionSyncFlow")
-    @patch("samcli.lib.sync.sync_flow_factory.ZipFunctionSyncFlow")
     @patch("samcli.lib.sync.sync_flow_factory.AutoDependencyLayerParentSyncFlow")
-    def test_create_lambda_flow_zip_with_unsupported_runtime_auto_dependency_layer(
-        self, auto_dependency_layer_mock, zip_function_mock, image_function_mock
-    ):
+    def test_create_lambda_flow_zip_with_unsupported_runtime_auto_dependency_layer(self, auto_dependency_layer_mock):
         factory = self.create_factory(True)
         resource = {"Properties": {"PackageType": "Zip", "Runtime": "ruby2.7"}}
-        result = factory._create_lambda_flow("Function1", resource)
-        self.assertEqual(result, zip_function_mock.return_value)
+        result = factory._create_lambda_flow(ResourceIdentifier("Function1"), resource)
+        self.assertEqual(result, self.zip_function_mock.return_value)
 
-    @patch("samcli.lib.sync.sync_flow_factory.ImageFunctionSyncFlow")
-    @patch("samcli.lib.sync.sync_flow_factory.ZipFunctionSyncFlow")
-    def test_create_lambda_flow_image(self, zip_function_mock, image_function_mock):
+    def test_create_lambda_flow_no_properties(self):
+        factory = self.create_factory()
+        result = factory._create_lambda_flow(ResourceIdentifier("Function1"), {})
+        self.assertEqual(result, self.zip_function_mock.return_value)
+
+    def test_create_lambda_flow_image(self):
         factory = self.create_factory()
         resource = {"Properties": {"PackageType": "Image"}}
-        result = factory._create_lambda_flow("Function1", resource)
-        self.assertEqual(result, image_function_mock.return_value)
+        result = factory._create_lambda_flow(ResourceIdentifier("Function1"), resource)
+        self.assertEqual(result, self.image_function_mock.return_value)
 
     @patch("samcli.lib.sync.sync_flow_factory.LayerSyncFlow")
     def test_create_layer_flow(self, layer_sync_mock):
         factory = self.create_factory()
-        result = factory._create_layer_flow("Layer1", {})
+        result = factory._create_layer_flow(ResourceIdentifier("Layer1"), {})
         self.assertEqual(result, layer_sync_mock.return_value)
 
-    @patch("samcli.lib.sync.sync_flow_factory.ImageFunctionSyncFlow")
-    @patch("samcli.lib.sync.sync_flow_factory.ZipFunctionSyncFlow")
-    def test_create_lambda_flow_other(self, zip_function_mock, image_function_mock):
+    def test_create_lambda_flow_other(self):
         factory = self.create_factory()
         resource = {"Properties": {"PackageType": "Other"}}
-        result = factory._create_lambda_flow("Function1", resource)
+        result = factory._create_lambda_flow(ResourceIdentifier("Function1"), resource)
         self.assertEqual(result, None)
 
     @patch("samcli.lib.sync.sync_flow_factory.RestApiSyncFlow")
     def test_create_rest_api_flow(self, rest_api_sync_mock):
         factory = self.create_factory()
-        result = factory._create_rest_api_flow("API1", {})
+        result = factory._create_rest_api_flow(ResourceIdentifier("API1"), {})
         self.assertEqual(result, rest_api_sync_mock.return_value)
 
     @patch("samcli.lib.sync.sync_flow_factory.HttpApiSyncFlow")
     def test_create_api_flow(self, http_api_sync_mock):
         factory = self.create_factory()
-        result = factory._create_api_flow("API1", {})
+        result = factory._create_api_flow(ResourceIdentifier("API1"), {})
         self.assertEqual(result, http_api_sync_mock.return_value)
 
     @patch("samcli.lib.sync.sync_flow_factory.StepFunctionsSyncFlow")
     def test_create_stepfunctions_flow(self, stepfunctions_sync_mock):
         factory = self.create_factory()
-        result = factory._create_stepfunctions_flow("StateMachine1", {})
+        result = factory._create_stepfunctions_flow(ResourceIdentifier("StateMachine1"), {})
         self.assertEqual(result, stepfunctions_sync_mock.return_value)
 
-    @patch("samcli.lib.sync.sync_flow_factory.get_resource_by_id")
-    def test_create_sync_flow(self, get_resource_by_id_mock):
+    def test_no_instance_dict(self):
+        factory = self.create_factory()
+        self.assertFalse(hasattr(factory, "__dict__"))
+
+    def test_generators_are_bound(self):
+        factory = self.create_factory()
+
+        self.assertEqual(factory._generators.keys(), SyncFlowFactory.GENERATOR_MAPPING.keys())
+        self.assertEqual(factory._generators[AWS_LAMBDA_FUNCTION], factory._create_lambda_flow)
+        self.assertEqual(factory._generators[AWS_SERVERLESS_LAYERVERSION], factory._create_layer_flow)
+
+    def test_syncable_resource_types(self):
+        self.assertIsInstance(SyncFlowFactory.SYNCABLE_RESOURCE_TYPES, frozenset)
+        self.assertEqual(SyncFlowFactory.SYNCABLE_RESOURCE_TYPES, SyncFlowFactory.GENERATOR_MAPPING.keys())
+
+    def test_create_sync_flow(self):
         factory = self.create_factory()
 
         sync_flow = MagicMock()
-        resource_identifier = MagicMock()
-        get_resource_by_id = MagicMock()
-        get_resource_by_id_mock.return_value = get_resource_by_id
+        resource_identifier = ResourceIdentifier("CDKResource2")
         generator_mock = MagicMock()
         generator_mock.return_value = sync_flow
 
-        get_generator_function_mock = MagicMock()
-        get_generator_function_mock.return_value = generator_mock
-        factory._get_generator_function = get_generator_function_mock
+        factory._generators = {"TypeB": generator_mock}
 
         result = factory.create_sync_flow(resource_identifier)
 
         self.assertEqual(result, sync_flow)
-        generator_mock.assert_called_once_with(factory, resource_identifier, get_resource_by_id)
+        generator_mock.assert_called_once_with(resource_identifier, factory._stacks[0].resources["Resource2"])
 
-    @patch("samcli.lib.sync.sync_flow_factory.get_resource_by_id")
-    def test_create_unknown_resource_sync_flow(self, get_resource_by_id_mock):
-        get_resource_by_id_mock.return_value = None
+    def test_create_unknown_resource_sync_flow(self):
         factory = self.create_factory()
-        self.assertIsNone(factory.create_sync_flow(MagicMock()))
+        self.assertIsNone(factory.create_sync_flow(ResourceIdentifier("Resource3")))
 
-    @patch("samcli.lib.sync.sync_flow_factory.get_resource_by_id")
-    def test_create_none_generator_sync_flow(self, get_resource_by_id_mock):
+    def test_create_none_generator_sync_flow(self):
         factory = self.create_factory()
 
-        resource_identifier = MagicMock()
-        get_resource_by_id = MagicMock()
-        get_resource_by_id_mock.return_value = get_resource_by_id
+        factory._generators = {}
 
-        get_generator_function_mock = MagicMock()
-        get_generator_function_mock.return_value = None
-        factory._get_generator_function = get_generator_function_mock
+        self.assertIsNone(factory.create_sync_flow(ResourceIdentifier("Resource1")))
+
+    def test_create_invalid_type_sync_flow(self):
+        factory = self.create_factory()
+        factory._stacks[0].resources["Resource1"]["Type"] = {"Fn::Sub": "TypeA"}
 
-        self.assertIsNone(factory.create_sync_flow(resource_identifier))
+        self.assertIsNone(factory.create_sync_flow(ResourceIdentifier("Resource1")))
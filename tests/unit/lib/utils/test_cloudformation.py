@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from unittest import TestCase
 from unittest.mock import patch, Mock, ANY, call
 
@@ -56,46 +57,72 @@ class TestCloudformationUtils(TestCase):
             given_resource_provider, given_stack_name, given_resource_types
         )
 
-    def test_get_resource_summaries(self):
-        resource_provider_mock = Mock()
+    @patch("samcli.lib.utils.cloudformation.ThreadPoolExecutor")
+    def test_get_resource_summaries(self, patched_executor):
+        client_provider_mock = Mock()
         given_stack_name = "stack_name"
         given_resource_types = {"ResourceType0"}
 
-        given_stack_resource_array = [
-            Mock(
-                physical_resource_id="physical_id_1", logical_resource_id="logical_id_1", resource_type="ResourceType0"
-            ),
-            Mock(
-                physical_resource_id="physical_id_2", logical_resource_id="logical_id_2", resource_type="ResourceType0"
-            ),
-            Mock(
-                physical_resource_id="physical_id_3", logical_resource_id="logical_id_3", resource_type="ResourceType1"
-            ),
-            Mock(
-                physical_resource_id="physical_id_4",
-                logical_resource_id="logical_id_4",
-                resource_type=AWS_CLOUDFORMATION_STACK,
-            ),
+        given_stack_resource_pages = [
+            {
+                "StackResourceSummaries": [
+                    {
+                        "PhysicalResourceId": "physical_id_1",
+                        "LogicalResourceId": "logical_id_1",
+                        "ResourceType": "ResourceType0",
+                    },
+                    {
+                        "PhysicalResourceId": "physical_id_2",
+                        "LogicalResourceId": "logical_id_2",
+                        "ResourceType": "ResourceType0",
+                    },
+                ]
+            },
+            {
+                "StackResourceSummaries": [
+                    {
+                        "PhysicalResourceId": "physical_id_3",
+                        "LogicalResourceId": "logical_id_3",
+                        "ResourceType": "ResourceType1",
+                    },
+                    {
+                        "PhysicalResourceId": "physical_id_4",
+                        "LogicalResourceId": "logical_id_4",
+                        "ResourceType": AWS_CLOUDFORMATION_STACK,
+                    },
+                ]
+            },
         ]
 
-        given_nested_stack_resource_array = [
-            Mock(
-                physical_resource_id="physical_id_5", logical_resource_id="logical_id_5", resource_type="ResourceType0"
-            ),
-            Mock(
-                physical_resource_id="physical_id_6", logical_resource_id="logical_id_6", resource_type="ResourceType0"
-            ),
-            Mock(
-                physical_resource_id="physical_id_7", logical_resource_id="logical_id_7", resource_type="ResourceType1"
-            ),
+        given_nested_stack_resource_pages = [
+            {
+                "StackResourceSummaries": [
+                    {
+                        "PhysicalResourceId": "physical_id_5",
+                        "LogicalResourceId": "logical_id_5",
+                        "ResourceType": "ResourceType0",
+                    },
+                    {
+                        "PhysicalResourceId": "physical_id_6",
+                        "LogicalResourceId": "logical_id_6",
+                        "ResourceType": "ResourceType0",
+                    },
+                    {
+                        "PhysicalResourceId": "physical_id_7",
+                        "LogicalResourceId": "logical_id_7",
+                        "ResourceType": "ResourceType1",
+                    },
+                ]
+            },
         ]
 
-        resource_provider_mock(ANY).Stack(ANY).resource_summaries.all.side_effect = [
-            given_stack_resource_array,
-            given_nested_stack_resource_array,
+        paginator_mock = client_provider_mock(ANY).get_paginator.return_value
+        paginator_mock.paginate.side_effect = [
+            given_stack_resource_pages,
+            given_nested_stack_resource_pages,
         ]
 
-        resource_summaries = get_resource_summaries(resource_provider_mock, given_stack_name, given_resource_types)
+        resource_summaries = get_resource_summaries(client_provider_mock, given_stack_name, given_resource_types)
 
         self.assertEqual(len(resource_summaries), 4)
         self.assertEqual(
@@ -112,45 +139,93 @@ class TestCloudformationUtils(TestCase):
             },
         )
 
-        resource_provider_mock.assert_called_with("cloudformation")
-        resource_provider_mock(ANY).Stack.assert_has_calls(
+        client_provider_mock.assert_called_with("cloudformation")
+        client_provider_mock(ANY).get_paginator.assert_called_with("list_stack_resources")
+        paginator_mock.paginate.assert_has_calls(
             [
-                call(given_stack_name),
-                call().resource_summaries.all(),
-                call("physical_id_4"),
-                call().resource_summaries.all(),
+                call(StackName=given_stack_name),
+                call(StackName="physical_id_4"),
             ]
         )
+        # each level only has a single stack, so they are listed without starting any worker
+        patched_executor.assert_not_called()
+
+    @patch("samcli.lib.utils.cloudformation.ThreadPoolExecutor", wraps=ThreadPoolExecutor)
+    def test_get_resource_summaries_multiple_nested_stacks(self, patched_executor):
+        client_provider_mock = Mock()
+
+        def summary(logical_id, physical_id, resource_type):
+            return {"LogicalResourceId": logical_id, "PhysicalResourceId": physical_id, "ResourceType": resource_type}
+
+        given_stack_resources = {
+            "stack_name": [
+                summary("Function1", "physical_function_1", "ResourceType0"),
+                summary("StackA", "stack_a_arn", AWS_CLOUDFORMATION_STACK),
+                summary("StackB", "stack_b_arn", AWS_CLOUDFORMATION_STACK),
+                {"LogicalResourceId": "StackD", "ResourceType": AWS_CLOUDFORMATION_STACK},
+            ],
+            "stack_a_arn": [
+                summary("Function2", "physical_function_2", "ResourceType0"),
+                summary("StackC", "stack_c_arn", AWS_CLOUDFORMATION_STACK),
+            ],
+            "stack_b_arn": [summary("Function3", "physical_function_3", "ResourceType0")],
+            "stack_c_arn": [summary("Function4", "physical_function_4", "ResourceType0")],
+        }
+
+        paginator_mock = client_provider_mock(ANY).get_paginator.return_value
+        paginator_mock.paginate.side_effect = lambda StackName: [
+            {"StackResourceSummaries": given_stack_resources[StackName]}
+        ]
+
+        resource_summaries = get_resource_summaries(client_provider_mock, "stack_name", {"ResourceType0"})
+
+        self.assertEqual(
+            resource_summaries,
+            {
+                "Function1": CloudFormationResourceSummary("ResourceType0", "Function1", "physical_function_1"),
+                "StackA/Function2": CloudFormationResourceSummary("ResourceType0", "Function2", "physical_function_2"),
+                "StackB/Function3": CloudFormationResourceSummary("ResourceType0", "Function3", "physical_function_3"),
+                "StackA/StackC/Function4": CloudFormationResourceSummary(
+                    "ResourceType0", "Function4", "physical_function_4"
+                ),
+            },
+        )
+        self.assertEqual(paginator_mock.paginate.call_count, 4)
+        patched_executor.assert_called_once()
 
     def test_get_resource_summary(self):
-        resource_provider_mock = Mock()
+        client_provider_mock = Mock()
         given_stack_name = "stack_name"
         given_resource_logical_id = "logical_id_1"
 
         given_resource_type = "ResourceType0"
         given_physical_id = "physical_id_1"
-        resource_provider_mock(ANY).StackResource.return_value = Mock(
-            physical_resource_id=given_physical_id,
-            logical_resource_id=given_resource_logical_id,
-            resource_type=given_resource_type,
-        )
+        client_provider_mock(ANY).describe_stack_resource.return_value = {
+            "StackResourceDetail": {
+                "PhysicalResourceId": given_physical_id,
+                "LogicalResourceId": given_resource_logical_id,
+                "ResourceType": given_resource_type,
+            }
+        }
 
-        resource_summary = get_resource_summary(resource_provider_mock, given_stack_name, given_resource_logical_id)
+        resource_summary = get_resource_summary(client_provider_mock, given_stack_name, given_resource_logical_id)
 
         self.assertEqual(resource_summary.resource_type, given_resource_type)
         self.assertEqual(resource_summary.logical_resource_id, given_resource_logical_id)
         self.assertEqual(resource_summary.physical_resource_id, given_physical_id)
 
-        resource_provider_mock.assert_called_with("cloudformation")
-        resource_provider_mock(ANY).StackResource.assert_called_with(given_stack_name, given_resource_logical_id)
+        client_provider_mock.assert_called_with("cloudformation")
+        client_provider_mock(ANY).describe_stack_resource.assert_called_with(
+            StackName=given_stack_name, LogicalResourceId=given_resource_logical_id
+        )
 
     def test_get_resource_summary_fail(self):
-        resource_provider_mock = Mock()
+        client_provider_mock = Mock()
         given_stack_name = "stack_name"
         given_resource_logical_id = "logical_id_1"
 
-        resource_provider_mock(ANY).StackResource.side_effect = ClientError({}, "operation")
+        client_provider_mock(ANY).describe_stack_resource.side_effect = ClientError({}, "operation")
 
-        resource_summary = get_resource_summary(resource_provider_mock, given_stack_name, given_resource_logical_id)
+        resource_summary = get_resource_summary(client_provider_mock, given_stack_name, given_resource_logical_id)
 
         self.assertIsNone(resource_summary)
@@ -12,13 +12,18 @@ class TestResourceTypeBasedFactory(TestCase):
         self.factory = ResourceTypeBasedFactory(self.stacks)
         self.function_generator_mock = MagicMock()
         self.layer_generator_mock = MagicMock()
-        self.factory._get_generator_mapping = MagicMock()
-        self.factory._get_generator_mapping.return_value = {
-            "AWS::Lambda::Function": self.function_generator_mock,
-            "AWS::Lambda::LayerVersion": self.layer_generator_mock,
-        }
+        self.generator_mapping_patch = patch.object(
+            ResourceTypeBasedFactory,
+            "_get_generator_mapping",
+            return_value={
+                "AWS::Lambda::Function": self.function_generator_mock,
+                "AWS::Lambda::LayerVersion": self.layer_generator_mock,
+            },
+        )
+        self.generator_mapping_patch.start()
 
     def tearDown(self):
+        self.generator_mapping_patch.stop()
         self.abstract_method_patch.stop()
 
     @patch("samcli.lib.utils.resource_type_based_factory.get_resource_by_id")
@@ -46,3 +51,14 @@ class TestResourceTypeBasedFactory(TestCase):
         generator = self.factory._get_generator_function(ResourceIdentifier("Resource1"))
 
         self.assertEqual(None, generator)
+
+    @patch("samcli.lib.utils.resource_type_based_factory.get_resource_by_id")
+    def test_get_generator_function_with_resource_index(self, get_resource_by_id_mock):
+        resource_identifier = ResourceIdentifier("Resource1")
+        resource_index = MagicMock()
+        get_resource_by_id_mock.return_value = {"Type": "AWS::Lambda::LayerVersion"}
+
+        generator = self.factory._get_generator_function(resource_identifier, resource_index)
+
+        self.assertEqual(generator, self.layer_generator_mock)
+        get_resource_by_id_mock.assert_called_once_with(self.stacks, resource_identifier, index=resource_index)